@@ -28,57 +28,134 @@ sophisticated NLP models.
 
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import List, Dict, Any
+import tempfile
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Tuple, Union
 
 from fastapi import FastAPI, UploadFile, File, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, ORJSONResponse
 
 import fitz  # PyMuPDF
+import xxhash
 
 # Import comparison utilities.  When this module is executed from within the
 # package (e.g. via `uvicorn regimed_mvp_project.app:app`), relative imports
 # will succeed.  When run as a standalone script (e.g. `python app.py`),
 # fallback to absolute imports.
 try:
-    from .compare import load_rules, check_rules, summarize_missing  # type: ignore[import-not-found]
+    from .compare import RulesBundle, load_rules_bundle, check_rules, summarize_missing  # type: ignore[import-not-found]
 except ImportError:
-    from compare import load_rules, check_rules, summarize_missing
+    from compare import RulesBundle, load_rules_bundle, check_rules, summarize_missing
 
 
-app = FastAPI(title="RegiMed MVP API", description="Minimal API for HIPAA compliance checking", version="0.1.0")
+app = FastAPI(
+    title="RegiMed MVP API",
+    description="Minimal API for HIPAA compliance checking",
+    version="0.1.0",
+    # orjson serializes responses in C, noticeably faster than the stdlib
+    # encoder for reports with many rule entries.
+    default_response_class=ORJSONResponse,
+)
 
 
-def extract_pdf(file_bytes: bytes) -> str:
-    """Extract text from a PDF file given its bytes.
+# Content-addressed LRU caches for repeat uploads.  Users often re-upload
+# the same document while iterating on rules, and PDF extraction dominates
+# request time; hashing the bytes with xxh3 is negligible by comparison.
+# `_TEXT_CACHE` maps content digest -> extracted text; `_RESULTS_CACHE`
+# maps (digest, rules) -> compliance results.
+_CACHE_MAX = 128
+_TEXT_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_RESULTS_CACHE: "OrderedDict[Tuple[str, Tuple[str, ...]], List[Dict[str, Any]]]" = OrderedDict()
+
+
+def _cache_get(cache: OrderedDict, key: Any) -> Any:
+    """Fetch a cache entry and mark it most-recently-used, or None."""
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _cache_put(cache: OrderedDict, key: Any, value: Any) -> None:
+    """Insert a cache entry, evicting the least-recently-used overflow."""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > _CACHE_MAX:
+        cache.popitem(last=False)
+
+
+def get_rules_bundle() -> RulesBundle:
+    """Return the cached rules bundle for the configured rules file.
+
+    The underlying loader is keyed on the file's mtime, so this is a
+    cheap `os.stat` per request unless `rules.txt` has changed.
+    """
+    rules_path = os.environ.get("REGIMED_RULES_FILE", os.path.join(os.path.dirname(__file__), "rules.txt"))
+    return load_rules_bundle(rules_path)
+
+
+# Page count above which PDF text extraction is spread across a thread
+# pool.  PyMuPDF releases the GIL inside get_text, so threads parallelize
+# the per-page layout decoding; below this size the pool overhead wins.
+_PARALLEL_PAGE_THRESHOLD = 50
+
+
+def extract_pdf(source: Union[bytes, str]) -> str:
+    """Extract text from a PDF file given its bytes or a file path.
+
+    Opening from a path lets PyMuPDF read the document directly from
+    disk, avoiding a whole-file bytes copy in memory.  Large documents
+    (over `_PARALLEL_PAGE_THRESHOLD` pages) are extracted page-by-page
+    across a thread pool; PyMuPDF drops the GIL during `get_text`, so
+    this scales with available cores.
 
     Parameters
     ----------
-    file_bytes : bytes
-        Raw bytes of the PDF file.
+    source : bytes or str
+        Raw bytes of the PDF file, or a path to it on disk.
 
     Returns
     -------
     str
         The concatenated text of all pages in the PDF.
     """
-    text = ""
-    with fitz.open(stream=file_bytes, filetype="pdf") as doc:
-        for page in doc:
-            text += page.get_text()
-    return text
+    if isinstance(source, str):
+        doc_handle = fitz.open(source)
+    else:
+        doc_handle = fitz.open(stream=source, filetype="pdf")
+    # Collect page texts in a list and join once at the end; repeated
+    # string += is quadratic in the total number of bytes for large PDFs.
+    with doc_handle as doc:
+        if doc.page_count >= _PARALLEL_PAGE_THRESHOLD:
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                parts = list(
+                    executor.map(
+                        lambda number: doc.load_page(number).get_text("text"),
+                        range(doc.page_count),
+                    )
+                )
+        else:
+            parts = [page.get_text("text") for page in doc]
+    return "".join(parts)
+
+
+def _read_text_file(path: str) -> str:
+    """Read an uploaded plain-text file, ignoring undecodable bytes."""
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        return f.read()
 
 
 @app.get("/rules", response_model=List[str])
 async def get_rules() -> List[str]:
     """Return the list of compliance rules currently defined in `rules.txt`."""
-    rules_path = os.environ.get("REGIMED_RULES_FILE", os.path.join(os.path.dirname(__file__), "rules.txt"))
-    rules = load_rules(rules_path)
-    return rules
+    return list(get_rules_bundle().rules)
 
 
 @app.post("/upload")
-async def upload_file(file: UploadFile = File(...)) -> JSONResponse:
+async def upload_file(file: UploadFile = File(...)) -> Dict[str, Any]:
     """Accept a PDF or plain‑text document and return a compliance report.
 
     Parameters
@@ -89,64 +166,83 @@ async def upload_file(file: UploadFile = File(...)) -> JSONResponse:
 
     Returns
     -------
-    JSONResponse
+    Dict[str, Any]
         A JSON object summarising which rules were found and which were
-        missing.  Includes a boolean `compliant` flag.
+        missing.  Includes a boolean `compliant` flag.  Serialized by
+        the app-wide `ORJSONResponse`.
     """
     filename = file.filename or ""
     extension = os.path.splitext(filename)[-1].lower()
     if extension not in {".pdf", ".txt"}:
         raise HTTPException(status_code=400, detail="Only .pdf and .txt files are supported")
 
-    file_bytes = await file.read()
-    if not file_bytes:
-        raise HTTPException(status_code=400, detail="Uploaded file is empty")
-
-    # Extract text depending on file type
-    if extension == ".pdf":
-        try:
-            text = extract_pdf(file_bytes)
-        except Exception as exc:
-            raise HTTPException(status_code=400, detail=f"Could not parse PDF: {exc}")
-    else:
-        # decode as UTF‑8; ignore errors to avoid raising for binary bytes in text file
-        try:
-            text = file_bytes.decode("utf-8", errors="ignore")
-        except Exception as exc:
-            raise HTTPException(status_code=400, detail=f"Could not read text file: {exc}")
+    # Stream the upload to a temporary file in 1 MiB chunks, hashing as we
+    # go, so the whole document is never held in memory at once.
+    hasher = xxhash.xxh3_128()
+    size = 0
+    tmp = tempfile.NamedTemporaryFile(suffix=extension, delete=False)
+    try:
+        while chunk := await file.read(1 << 20):
+            hasher.update(chunk)
+            size += len(chunk)
+            tmp.write(chunk)
+        tmp.close()
+        if size == 0:
+            raise HTTPException(status_code=400, detail="Uploaded file is empty")
+        digest = hasher.hexdigest()
+
+        # PDF parsing and rule checking are CPU-bound; run them in a worker
+        # thread so concurrent uploads don't serialize on the event loop.
+        # Repeat uploads of the same bytes short-circuit via the content cache.
+        if extension == ".pdf":
+            text = _cache_get(_TEXT_CACHE, digest)
+            if text is None:
+                try:
+                    text = await asyncio.to_thread(extract_pdf, tmp.name)
+                except Exception as exc:
+                    raise HTTPException(status_code=400, detail=f"Could not parse PDF: {exc}")
+                _cache_put(_TEXT_CACHE, digest, text)
+        else:
+            # decode as UTF‑8; ignore errors to avoid raising for binary bytes in text file
+            try:
+                text = await asyncio.to_thread(_read_text_file, tmp.name)
+            except Exception as exc:
+                raise HTTPException(status_code=400, detail=f"Could not read text file: {exc}")
+    finally:
+        tmp.close()
+        os.unlink(tmp.name)
 
     # Load rules and check against document text
-    rules_path = os.environ.get("REGIMED_RULES_FILE", os.path.join(os.path.dirname(__file__), "rules.txt"))
-    rules = load_rules(rules_path)
-    results = check_rules(text, rules)
+    bundle = get_rules_bundle()
+    results_key = (digest, bundle.rules)
+    results = _cache_get(_RESULTS_CACHE, results_key)
+    if results is None:
+        results = await asyncio.to_thread(check_rules, text, bundle)
+        _cache_put(_RESULTS_CACHE, results_key, results)
     missing = summarize_missing(results)
     response: Dict[str, Any] = {
         "filename": filename,
-        "total_rules": len(rules),
-        "rules_found": len(rules) - len(missing),
+        "total_rules": len(bundle.rules),
+        "rules_found": len(bundle.rules) - len(missing),
         "rules_missing": len(missing),
         "missing_rules": missing,
         "details": results,
         "compliant": len(missing) == 0,
     }
-    return JSONResponse(content=response)
+    return response
 
 
 @app.get("/regulations")
-async def get_regulations() -> JSONResponse:
+async def get_regulations():
     """Return the scraped HIPAA regulation pages stored in `regulations.json`.
 
     The scraper script writes a JSON array with entries containing `url`
-    and `content`.  This endpoint simply reads the file and returns it
-    directly.  If the file does not exist, an empty array is returned.
+    and `content`.  The file is already valid JSON, so it is streamed to
+    the client as-is via `FileResponse` rather than being parsed and
+    re-serialized on every request.  If the file does not exist, an
+    empty array is returned.
     """
     path = os.environ.get("REGIMED_REGULATIONS_FILE", os.path.join(os.path.dirname(__file__), "regulations.json"))
     if not os.path.exists(path):
         return JSONResponse(content=[])
-    try:
-        import json
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        return JSONResponse(content=data)
-    except Exception as exc:
-        raise HTTPException(status_code=500, detail=f"Could not read regulations file: {exc}")
+    return FileResponse(path, media_type="application/json")
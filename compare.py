@@ -2,16 +2,180 @@
 Utility functions for loading compliance rules and comparing them against
 the contents of uploaded medical documents.  The comparison logic in this
 module deliberately errs on the side of simplicity: each rule is searched
-within the document text, and a basic similarity ratio is calculated using
-Python's built‑in `difflib` module.  This approach is meant for a minimal
+within the document text, and a fuzzy similarity ratio is calculated using
+the `rapidfuzz` library, whose C++ implementation scores all rules against
+the document in a single call.  This approach is meant for a minimal
 viable product and should be replaced with more robust NLP techniques in
 future iterations (e.g. spaCy, HuggingFace transformers or GPT models).
 """
 
 from __future__ import annotations
 
-from typing import Iterable, List, Dict, Any
-import difflib
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Dict, Any, Optional, Tuple, Union
+import functools
+import os
+import re
+import unicodedata
+
+import ahocorasick
+import numpy as np
+from rapidfuzz import fuzz, process
+
+
+@dataclass(frozen=True)
+class RulesBundle:
+    """A set of compliance rules together with its precomputed matchers.
+
+    Bundles are built once per distinct rule set and shared across
+    requests, so the normalization and automaton construction are not
+    repeated per upload.
+    """
+
+    rules: Tuple[str, ...]
+    rules_norm: Tuple[str, ...]
+    automaton: "ahocorasick.Automaton"
+    bitsets: Tuple[int, ...]
+    matchers: Tuple[Optional[Callable[[str], Any]], ...]
+    # ASCII-encoded rules, present only when every normalized rule is
+    # pure ASCII.  HIPAA clauses overwhelmingly are, and comparing bytes
+    # keeps the fuzzy scorer on CPython's 1-byte-per-char path instead
+    # of the wider UCS representations.
+    rules_bytes: Optional[Tuple[bytes, ...]] = None
+
+
+# Cache of compiled Aho–Corasick automata keyed on the (normalized) rules.
+# Rule sets are small and change rarely, so the automaton is built once per
+# distinct set and reused across uploads.
+_automaton_cache: Dict[Tuple[str, ...], "ahocorasick.Automaton"] = {}
+
+# Cache of rule bundles keyed on path, invalidated by file mtime.  This
+# amortizes the disk read, parse and matcher construction across requests.
+_bundle_cache: Dict[str, Tuple[int, RulesBundle]] = {}
+
+
+def _normalize(s: str) -> str:
+    """Normalize text for matching: NFKC composition plus casefolding.
+
+    NFKC folds compatibility forms (full-width characters, ligatures)
+    into their canonical equivalents, and `casefold` is a more aggressive
+    and locale-safe lowering than `str.lower` (e.g. German ß → ss).  Both
+    the rules (once, at load time) and each document (once, per upload)
+    pass through this, so every matcher compares like with like.
+    """
+    return unicodedata.normalize("NFKC", s).casefold()
+
+
+def _get_automaton(rules_norm: Tuple[str, ...]) -> "ahocorasick.Automaton":
+    """Return a compiled Aho–Corasick automaton for the given rules.
+
+    The automaton matches every rule as a substring in a single linear
+    sweep over the document, replacing the per-rule ``in`` scans.
+    """
+    automaton = _automaton_cache.get(rules_norm)
+    if automaton is None:
+        automaton = ahocorasick.Automaton()
+        for index, rule_norm in enumerate(rules_norm):
+            automaton.add_word(rule_norm, index)
+        if rules_norm:
+            automaton.make_automaton()
+        _automaton_cache[rules_norm] = automaton
+    return automaton
+
+def _char_bitset(s: Union[str, bytes]) -> int:
+    """Hash the character set of a string into a 64-bit mask.
+
+    Each character sets one of 64 bits (``ord(c) & 63``).  If a rule's
+    mask has bits not present in the document's mask, at least one of the
+    rule's characters cannot occur in the document, so the expensive
+    fuzzy scorer can be skipped outright.  Accepts bytes as well, where
+    iteration already yields the code points directly.
+    """
+    bits = 0
+    for c in set(s):
+        bits |= 1 << ((c if isinstance(c, int) else ord(c)) & 63)
+    return bits
+
+
+# Metacharacters that mark a rule as a regular expression rather than a
+# plain clause to be matched verbatim.
+_REGEX_MARKERS = re.compile(r"\.\*|\[|\\b|\\d|\\w|\|")
+
+
+def _compile_matcher(rule: str) -> Optional[Callable[[str], Any]]:
+    """Compile a specialized matcher for a rule, decided once at load time.
+
+    Rules containing regex metacharacters (``.*``, ``[``, ``\\b`` …) are
+    compiled to a case-insensitive pattern whose bound ``search`` method
+    is returned.  Plain-text rules return ``None``: their substring
+    matching is already covered by the Aho–Corasick sweep, so no per-call
+    dispatch is needed for them.
+    """
+    if _REGEX_MARKERS.search(rule):
+        try:
+            return re.compile(rule, re.IGNORECASE).search
+        except re.error:
+            # Not a valid pattern after all; treat it as literal text.
+            return None
+    return None
+
+
+def _build_bundle(rules: Iterable[str]) -> RulesBundle:
+    """Construct a `RulesBundle` with all precomputed matchers."""
+    rules = tuple(rules)
+    rules_norm = tuple(_normalize(rule) for rule in rules)
+    all_ascii = all(rule_norm.isascii() for rule_norm in rules_norm)
+    return RulesBundle(
+        rules=rules,
+        rules_norm=rules_norm,
+        automaton=_get_automaton(rules_norm),
+        bitsets=tuple(_char_bitset(rule_norm) for rule_norm in rules_norm),
+        matchers=tuple(_compile_matcher(rule) for rule in rules),
+        rules_bytes=tuple(rule_norm.encode("ascii") for rule_norm in rules_norm) if all_ascii else None,
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _bundle_for_rules(rules: Tuple[str, ...]) -> RulesBundle:
+    """Build (or reuse) a bundle for a rule set passed as plain strings.
+
+    Callers that hand `check_rules` an iterable instead of a
+    `RulesBundle` still get the precomputed normalization, bitsets and
+    matchers cached across calls rather than rebuilt per request.
+    """
+    return _build_bundle(rules)
+
+
+def load_rules_bundle(path: str = "rules.txt") -> RulesBundle:
+    """Load compliance rules from a file as a cached `RulesBundle`.
+
+    The bundle is cached keyed on the file path and invalidated when the
+    file's modification time changes, so repeated calls (one per API
+    request) cost a single `os.stat` instead of a disk read plus matcher
+    rebuild.
+
+    Parameters
+    ----------
+    path : str
+        Path to the rules file.
+
+    Returns
+    -------
+    RulesBundle
+        The rules plus their precomputed matchers.  Missing files yield
+        an empty bundle.
+    """
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return _build_bundle(())
+    cached = _bundle_cache.get(path)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+    bundle = _build_bundle(load_rules(path))
+    _bundle_cache[path] = (mtime_ns, bundle)
+    return bundle
+
 
 def load_rules(path: str = "rules.txt") -> List[str]:
     """Load compliance rules from a plain‑text file.
@@ -38,19 +202,46 @@ def load_rules(path: str = "rules.txt") -> List[str]:
         return []
 
 
-def check_rules(text: str, rules: Iterable[str], threshold: float = 0.5) -> List[Dict[str, Any]]:
+def _prepare_text(text: str) -> str:
+    """Precompute the per-document form used by every matcher.
+
+    The document is fixed while all rules are checked against it, so the
+    per-document work (NFKC normalization plus casefolding) is done
+    exactly once here rather than inside the rule loop.  Both the
+    automaton sweep and the single cdist call then reuse the same
+    prepared string, which keeps the per-rule cost free of redundant
+    document passes.
+    """
+    return _normalize(text)
+
+
+def check_rules(
+    text: str,
+    rules: Union[RulesBundle, Iterable[str]],
+    threshold: float = 0.5,
+) -> List[Dict[str, Any]]:
     """Check whether each rule appears in the given document text.
 
-    A rule is considered **found** if either the rule (lowercased) is a
-    substring of the document (lowercased), or the quick similarity ratio
-    computed by `difflib.SequenceMatcher` exceeds the supplied threshold.
-    
+    A rule is considered **found** if either the rule is a substring of
+    the document (both NFKC-normalized and casefolded), or the partial
+    similarity ratio
+    computed by `rapidfuzz.fuzz.partial_ratio` exceeds the supplied
+    threshold.  Substring matches for all rules are located in a single
+    Aho–Corasick pass over the document; only rules without an exact
+    substring hit are scored with `rapidfuzz.process.cdist`, which runs in
+    C++, releases the GIL and parallelizes across cores.  Rules written as
+    regular expressions (detected at load time) are decided by their
+    precompiled pattern instead.
+
+
     Parameters
     ----------
     text : str
         The text of the uploaded document to analyse.
-    rules : Iterable[str]
-        A sequence of compliance rules to search for.
+    rules : RulesBundle or Iterable[str]
+        The compliance rules to search for.  Passing a `RulesBundle`
+        (from `load_rules_bundle`) reuses its precomputed matchers; a
+        plain sequence of strings is wrapped in a transient bundle.
     threshold : float, optional
         Minimum similarity ratio for a rule to be considered present if
         substring matching fails.  Values range from 0 to 1.  Higher
@@ -61,13 +252,71 @@ def check_rules(text: str, rules: Iterable[str], threshold: float = 0.5) -> List
     List[Dict[str, Any]]
         A list of dictionaries, each containing the original rule, a
         boolean indicating whether it was found, and the similarity score.
+        Rules the scorer pruned below the threshold report a similarity
+        of 0.0.
     """
-    text_lower = text.lower()
+    bundle = rules if isinstance(rules, RulesBundle) else _bundle_for_rules(tuple(rules))
+    if not bundle.rules:
+        return []
+    rules_list = bundle.rules
+    rules_norm = bundle.rules_norm
+    text_norm = _prepare_text(text)
+    # When both the rules and the document are pure ASCII (the common
+    # case for HIPAA text), run the bitset and fuzzy stages on bytes so
+    # comparisons stay on the 1-byte stride.  The automaton keeps the str
+    # form: the PyPI pyahocorasick build stores unicode keys only.
+    text_bytes: Optional[bytes] = None
+    if bundle.rules_bytes is not None and text_norm.isascii():
+        text_bytes = text_norm.encode("ascii")
+    # Locate exact substring matches for all rules in one linear sweep.
+    found_set = {index for _, index in bundle.automaton.iter(text_norm)}
+    # Only rules without a substring hit need the fuzzy scorer, and among
+    # those only rules whose character set is a subset of the document's
+    # (bitset prefilter) can plausibly match.  cdist scores the survivors
+    # in one C++ call, returning an R×1 matrix of scores in the 0–100
+    # range; convert back to 0–1 ratios.  score_cutoff lets the C++
+    # implementation abandon a comparison as soon as its upper bound
+    # falls below the threshold; such rules come back as 0.0, which is
+    # fine because only the found/missing decision is needed.
+    doc_bits = _char_bitset(text_bytes if text_bytes is not None else text_norm)
+    ratios: Dict[int, float] = {}
+    fuzzy_indices = []
+    for i in range(len(rules_list)):
+        if i in found_set:
+            continue
+        matcher = bundle.matchers[i]
+        if matcher is not None:
+            # Regex rules are decided by their precompiled pattern alone;
+            # fuzzy scoring a pattern string would be meaningless.
+            if matcher(text):
+                found_set.add(i)
+            else:
+                ratios[i] = 0.0
+        elif bundle.bitsets[i] & doc_bits != bundle.bitsets[i]:
+            ratios[i] = 0.0
+        else:
+            fuzzy_indices.append(i)
+    if fuzzy_indices:
+        if text_bytes is not None:
+            queries = [bundle.rules_bytes[i] for i in fuzzy_indices]
+            choices = [text_bytes]
+        else:
+            queries = [rules_norm[i] for i in fuzzy_indices]
+            choices = [text_norm]
+        scores = process.cdist(
+            queries,
+            choices,
+            scorer=fuzz.partial_ratio,
+            workers=-1,
+            dtype=np.float32,
+            score_cutoff=threshold * 100.0,
+        )
+        for i, score in zip(fuzzy_indices, scores[:, 0]):
+            ratios[i] = float(score) / 100.0
     results: List[Dict[str, Any]] = []
-    for rule in rules:
-        rule_lower = rule.lower()
-        ratio = difflib.SequenceMatcher(None, rule_lower, text_lower).quick_ratio()
-        found = (rule_lower in text_lower) or (ratio >= threshold)
+    for i, rule in enumerate(rules_list):
+        ratio = ratios.get(i, 1.0)
+        found = (i in found_set) or (ratio >= threshold)
         results.append({
             "rule": rule,
             "found": found,